@@ -3,6 +3,7 @@ import pytest
 from .conftest import params
 
 from tuindow.cursor import Cursor as LibCursor
+from tuindow.cursor import GapBuffer
 from tuindow.cursor import Overscroll
 
 
@@ -480,3 +481,51 @@ def test_setting_maxline_clamps_line():
     cursor = MultilineCursor(["" for _ in range(5)], line=3)
     cursor.maxline = 2
     assert cursor.line == 2
+
+
+def test_gap_buffer_roundtrip():
+    buffer = GapBuffer("abcdef", 3)
+
+    assert str(buffer) == "abcdef"
+    assert len(buffer) == 6
+
+
+def test_gap_buffer_edits_at_gap():
+    buffer = GapBuffer("abcdef", 3)
+
+    buffer.insert("123")
+    assert str(buffer) == "abc123def"
+
+    assert buffer.backspace(2) == "23"
+    assert str(buffer) == "abc1def"
+
+    assert buffer.delete(1) == "d"
+    assert str(buffer) == "abc1ef"
+
+
+def test_gap_buffer_move_gap():
+    buffer = GapBuffer("abcdef", 0)
+
+    buffer.move_gap(4)
+    buffer.insert("!")
+    assert str(buffer) == "abcd!ef"
+
+    buffer.move_gap(1)
+    assert buffer.delete(2) == "bc"
+    assert str(buffer) == "ad!ef"
+
+
+def test_gap_buffer_zero_amounts_are_no_ops():
+    buffer = GapBuffer("abcdef", 3)
+
+    assert buffer.backspace(0) == ""
+    assert buffer.delete(0) == ""
+    assert str(buffer) == "abcdef"
+
+
+def test_gap_buffer_negative_amounts_consume_to_the_ends():
+    buffer = GapBuffer("abcdef", 3)
+
+    assert buffer.backspace(-1) == "abc"
+    assert buffer.delete(-1) == "def"
+    assert str(buffer) == ""
@@ -226,6 +226,26 @@ def test_first_available_after_clear():
     assert panel.first_available == 4
 
 
+def test_first_available_after_line_mutations():
+    panel = Panel(0, 0, 10, 3)
+
+    for i in range(3):
+        panel.writeln(i, "abc")
+    assert panel.first_available is None
+
+    panel.deleteln(0)
+    assert panel.first_available == 2
+
+    panel.insertln(0, "abc")
+    assert panel.first_available is None
+
+    panel.shift_up()
+    assert panel.first_available == 2
+
+    panel.shift_down(3)
+    assert panel.first_available == 0
+
+
 def test_write_if_available_when_available():
     panel = Panel(0, 0, 10, 2)
 
@@ -297,6 +317,20 @@ def test_cursor_raises_overscroll_errors_by_default_across_size_change():
     assert excinfo.value.amount == 2
 
 
+def test_shift_invalidates_painted_version():
+    panel = Panel(0, 0, 10, 3)
+    panel.writeln(0, "abc")
+
+    # simulate the draw machinery recording this version as painted
+    panel._painted_version = panel.version
+
+    # replaces every line with a fresh object; the panel version must
+    # still move or the renderer would skip the cleared panel entirely
+    panel.shift_up(3)
+
+    assert panel.version != panel._painted_version
+
+
 def test_shift_up():
     panel = Panel(0, 0, 10, 3)
     panel.writeln(0, "0")
@@ -439,3 +473,26 @@ def test_color_line_not_a_color(expect_error):
 
     with expect_error(ValueError, "AttributeBit"):
         panel.colorln(0, 999)
+
+
+def test_write_many():
+    panel = Panel(0, 0, 10, 4)
+
+    panel.write_many(("one", "two"), start=1)
+
+    assert panel[0].data == ""
+    assert panel[1].data == "one"
+    assert panel[2].data == "two"
+    assert panel[3].data == ""
+    assert panel.available == 2
+
+
+def test_write_many_clear_remaining():
+    panel = Panel(0, 0, 10, 4)
+    for i in range(4):
+        panel.writeln(i, "stale")
+
+    panel.write_many(("one", "two"), clear_remaining=True)
+
+    assert [ln.data for ln in panel] == ["one", "two", "", ""]
+    assert panel.available == 2
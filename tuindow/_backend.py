@@ -2,18 +2,19 @@
 All curses related code
 """
 
-from typing import Deque
 from typing import Callable
+from typing import List
 from typing import Generator
 from typing import Optional
 from typing import Dict
 from typing import Tuple
+from typing import Union
 
 import os
+import sys
 import enum
 import curses
 import string
-import collections
 
 from curses import ascii
 
@@ -80,9 +81,12 @@ def set_color_bit(attributes: int, color_bit: int) -> int:
     return cleaned
 
 
-class SpecialKeys(enum.Enum):
+class SpecialKeys(str, enum.Enum):
     """
     Keys that aren't represented by their corresponding single character.
+
+    Members are strings (str mixin) so comparing an input key against
+    them is a plain C-level string comparison.
     """
 
     BACKSPACE = "BACKSPACE"
@@ -193,9 +197,6 @@ class SpecialKeys(enum.Enum):
     KEY_UNDO = "Undo"
     KEY_MOUSE = "Mouse event has occurred"
 
-    def __eq__(self, other: object) -> bool:
-        return str(other) == self.value
-
 
 _curses_key_map: Dict[int, str] = {
     curses.KEY_BACKSPACE: SpecialKeys.BACKSPACE.value,
@@ -307,6 +308,29 @@ _curses_key_map: Dict[int, str] = {
     **{ord(c): c for c in string.printable},
 }
 
+# interned key strings let downstream comparisons and dict/set lookups
+# in user dispatch tables short-circuit on identity
+_curses_key_map = {
+    keycode: sys.intern(key) for keycode, key in _curses_key_map.items()
+}
+
+# flat table covering the full curses keycode range; indexing it is
+# cheaper per keystroke than dict hashing plus a chr() fallback.
+# frozen into a tuple -- it is never mutated after import
+def _build_key_table() -> Tuple[str, ...]:
+    # every slot is prefilled with its chr so in-range keycodes never
+    # take the fallback branch; special keys overwrite their slots
+    table = [
+        sys.intern(chr(i))
+        for i in range(max(max(_curses_key_map) + 1, 1024))
+    ]
+    for keycode, key in _curses_key_map.items():
+        table[keycode] = key
+    return tuple(table)
+
+
+_key_table = _build_key_table()
+
 
 class CursesError(Exception):
     pass
@@ -362,12 +386,17 @@ class Instance:
     _stdscr: curses.window
     _cursor_display: _CursorVisualState
     _resize_callback: Callable[[int, int], None]
-    _cached_keys: Optional[Deque[str]]
+    _cached_keys: List[int]
+    _cached_index: int
+    _size: Tuple[int, int]
 
     def __init__(self, resize_callback: Callable[[int, int], None]):
         self._cursor_display = _CursorVisualState()
         self._resize_callback = resize_callback
-        self._cached_keys = collections.deque()
+        # raw keycodes from getch; translated to key strings lazily on
+        # consumption so a paste burst only pays for appends at cache time
+        self._cached_keys = []
+        self._cached_index = 0
 
     def __repr__(self) -> str:
         return f"<Curses instance  size={self.size!r}>"
@@ -381,6 +410,8 @@ class Instance:
         self._stdscr = curses.initscr()
         self._stdscr.keypad(True)
         self._stdscr.nodelay(True)
+        height, width = self._stdscr.getmaxyx()
+        self._size = (width, height)
 
         curses.start_color()
 
@@ -432,22 +463,51 @@ class Instance:
         Polls for keys non-blocking and yields them when present.
         """
 
-        while self._cached_keys:
-            yield self._cached_keys.popleft()
-        while (keycode := self._stdscr.getch()) != -1:
-            if keycode == curses.KEY_RESIZE:
-                self._resize_callback(*self.size)
+        table = _key_table
+        table_length = len(table)
+        cached = self._cached_keys
+        if cached:
+            # drain by index rather than popping from the front; the
+            # index is kept on the instance so an abandoned generator
+            # doesn't re-deliver keys to the next one
+            index = self._cached_index
+            while index < len(cached):
+                keycode = cached[index]
+                self._cached_index = index = index + 1
+                yield (
+                    table[keycode]
+                    if keycode < table_length
+                    else chr(keycode)
+                )
+            cached.clear()
+            self._cached_index = 0
+        getch = self._stdscr.getch
+        resize_keycode = curses.KEY_RESIZE
+        while (keycode := getch()) != -1:
+            if keycode == resize_keycode:
+                self._refresh_size()
+                self._resize_callback(*self._size)
             else:
-                yield _curses_key_map.get(keycode, chr(keycode))
+                yield (
+                    table[keycode]
+                    if keycode < table_length
+                    else chr(keycode)
+                )
 
     @property
     def size(self) -> Tuple[int, int]:
         """
         Returns the size of the window measured in characters
+
+        The value is cached and refreshed whenever curses reports a
+        resize, so reading it doesn't query the terminal.
         """
 
+        return self._size
+
+    def _refresh_size(self) -> None:
         height, width = self._stdscr.getmaxyx()
-        return width, height
+        self._size = (width, height)
 
     def cache_pending_keys(self) -> None:
         """
@@ -456,14 +516,25 @@ class Instance:
         NOTE: triggers resize callback if resize encountered in keys
         """
 
-        cache = self._cached_keys or collections.deque()
-        self._cached_keys = None
-        cache.extend((k for k in self.keys))
-        self._cached_keys = cache
+        # drain getch directly with locally-bound lookups rather than
+        # spinning up the `keys` generator just to copy it into the cache
+        append = self._cached_keys.append
+        getch = self._stdscr.getch
+        resize_keycode = curses.KEY_RESIZE
+        while (keycode := getch()) != -1:
+            if keycode == resize_keycode:
+                self._refresh_size()
+                self._resize_callback(*self._size)
+            else:
+                append(keycode)
 
     def update_display(self) -> None:
+        # noutrefresh + doupdate is the standard ncurses batching idiom:
+        # mark the virtual screen, then let one doupdate compute the
+        # minimal physical writes for everything staged this frame
         self._cursor_display.draw(self._stdscr)
-        self._stdscr.refresh()
+        self._stdscr.noutrefresh()
+        curses.doupdate()
 
     def draw_cursor(self, x: int, y: int) -> None:
         self._cursor_display.enable()
@@ -472,17 +543,49 @@ class Instance:
     def disable_cursor(self) -> None:
         self._cursor_display.disable()
 
-    def write_text(self, x: int, y: int, value: str, attributes: int) -> None:
+    def write_text(
+        self, x: int, y: int, value: Union[str, bytes], attributes: int
+    ) -> None:
         """
-        Writes the given string to the screen at (x, y) where (0, 0) is the top left.
+        Writes the given text to the screen at (x, y) where (0, 0) is the top left.
+        Accepts utf-8 encoded bytes to let callers cache the encoding.
         Not displayed until display is updated.
 
         Raises CursesError when write fails.
         """
+        width, height = self._size
+        if y == height - 1:
+            text = value if isinstance(value, str) else value.decode()
+            if x + len(text) == width:
+                # writing the bottom-right cell through addstr errors
+                # because it leaves the cursor out of bounds; the
+                # idiomatic ncurses fix is to write all but the final
+                # character and insert the last one in place (insstr
+                # doesn't advance the cursor), keeping the steady-state
+                # draw path off the exception machinery
+                attrs = self._process_attributes(attributes)
+                try:
+                    if len(text) > 1:
+                        self._stdscr.addstr(y, x, text[:-1], attrs)
+                    self._stdscr.insstr(y, width - 1, text[-1], attrs)
+                except curses.error as exc:
+                    raise CursesError(
+                        "Curses write to screen failed:\n"
+                        f"    {self!r}\n"
+                        f"    write_location={x=!r}, {y=!r}\n"
+                        f"    {value=!r}\n"
+                        f"    {attributes=!r}\n"
+                        f"    internal error: {str(exc)}"
+                    )
+                return
         try:
-            self._stdscr.addstr(
-                y, x, value, self._process_attributes(attributes)
-            )
+            attrs = self._process_attributes(attributes)
+            if isinstance(value, str):
+                self._stdscr.addstr(y, x, value, attrs)
+            else:
+                # the curses binding accepts encoded bytes at runtime
+                # but typeshed annotates addstr as str-only
+                self._stdscr.addstr(y, x, value, attrs)  # type: ignore[call-overload]
         except curses.error as exc:
             # writing the last character in the window causes an error
             # because it places the cursor out of bounds and we are
@@ -490,8 +593,15 @@ class Instance:
 
             # TODO: revist once cursor has been implemented
 
-            width, height = self.size
-            if x + len(value) == width and y == height - 1:
+            # query the terminal directly -- a mid-draw resize means the
+            # cached size may not reflect reality yet
+            height, width = self._stdscr.getmaxyx()
+            length = (
+                len(value)
+                if isinstance(value, str)
+                else len(value.decode())
+            )
+            if x + length == width and y == height - 1:
                 return
             else:
                 raise CursesError(
@@ -280,26 +280,37 @@ CYAN = AttributeBit.CYAN
 
 
 class _Clock:
-    _interval: float
+    # timing is done on the integer monotonic clock: it can't jump with
+    # wall-clock adjustments and the per-tick arithmetic stays in ints
+    _interval_ns: int
     _tps: int
-    _previous: float
+    _previous_ns: int
     _ticks: int
 
     def __init__(self, tps: int) -> None:
-        self._interval = 1 / tps
+        self._interval_ns = 1_000_000_000 // tps
         self._tps = tps
-        self._previous = time.time()
+        self._previous_ns = time.monotonic_ns()
         self._ticks = 0
 
     def __next__(self) -> float:
-        remaining = self._interval - (time.time() - self._previous)
-        if remaining > 0:
-            time.sleep(remaining)
-        now = time.time()
-        dt = now - self._previous
-        self._previous = now
         self._ticks += 1
-        return dt
+        interval_ns = self._interval_ns
+        target_ns = self._previous_ns + interval_ns
+        now_ns = time.monotonic_ns()
+        remaining_ns = target_ns - now_ns
+        if remaining_ns > 0:
+            # on schedule: sleep out the remainder and advance by a
+            # fixed step instead of reading the clock a second time --
+            # any sleep jitter is absorbed by the next tick rather than
+            # accumulating as drift
+            time.sleep(remaining_ns / 1_000_000_000)
+            self._previous_ns = target_ns
+            return interval_ns / 1_000_000_000
+        # running behind: resynchronize on the measured time
+        dt_ns = now_ns - self._previous_ns
+        self._previous_ns = now_ns
+        return dt_ns / 1_000_000_000
 
     @property
     def ticks(self) -> int:
@@ -312,7 +323,7 @@ class _Clock:
     @tps.setter
     def tps(self, value: int) -> None:
         self._tps = value
-        self._interval = 1 / value
+        self._interval_ns = 1_000_000_000 // value
 
 
 _instance: Optional[_backend.Instance] = None
@@ -443,14 +454,19 @@ def draw(*panels: Panel) -> None:
     """
 
     assert _instance
-    size = _instance.size
-    try:
-        _unsafe_draw(*panels)
-    except _backend.CursesError:
-        if _instance.size != size:
+    # iterative retry -- a storm of resizes mid-draw shouldn't stack
+    # recursive frames
+    while True:
+        size = _instance.size
+        try:
+            _unsafe_draw(*panels)
+            return
+        except _backend.CursesError:
+            # draining pending keys processes any KEY_RESIZE, which both
+            # refreshes the cached size and fires the resize callback
             _instance.cache_pending_keys()
-            return draw(*panels)
-        raise
+            if _instance.size == size:
+                raise
 
 
 @_requires_init
@@ -489,17 +505,23 @@ def _unsafe_draw(*panels: Panel) -> None:
 
     active_cursor_drawn = False
 
+    write_text = _instance.write_text
     for panel in panels:
         dirty = _window.draw(panel.display_rect)
-        for i, line in enumerate(panel):
-            if dirty or line.dirty:
-                _instance.write_text(
-                    panel.left,
-                    panel.top + i,
-                    line.display,
-                    line.style.attributes,
-                )
-            line.dirty = False
+        version = panel.version
+        if dirty or version != panel._painted_version:
+            left = panel.left
+            top = panel.top
+            for i, line in enumerate(panel):
+                if dirty or line.dirty:
+                    write_text(
+                        left,
+                        top + i,
+                        line.display_bytes,
+                        line.style.attributes,
+                    )
+                line.dirty = False
+            panel._painted_version = version
 
         if _active_cursor is panel.cursor:
             _handle_active_cursor(panel, panel.cursor)
@@ -2,6 +2,10 @@
 The core data structures the package uses to represent a terminal display.
 """
 
+import types
+
+from typing import Callable
+from typing import Iterable
 from typing import Iterator
 from typing import Tuple
 from typing import Optional
@@ -19,16 +23,25 @@ class Line:
     """
     A simple object representing a sequence of characters in the TUI display.
 
-    Sets it's `dirty` attribute to True when it's state has changed.
+    Increments it's `version` attribute when it's state has changed. The
+    `dirty` flag is derived from `version` so a renderer may use either
+    protocol to track what it has painted.
     Validates `style` configuration.
     """
 
-    dirty: bool = True
-
-    _display: str = ""
-    _data: str = ""
-    _style: structs.Style = structs.Style()
-    _length: int = 1
+    __slots__ = (
+        "version",
+        "_clean_version",
+        "_on_change",
+        "_display",
+        "_data",
+        "_style",
+        "_length",
+        "_static_pads",
+        "_max_middle",
+        "_update_display",
+        "_display_bytes",
+    )
 
     def __init__(
         self,
@@ -48,6 +61,22 @@ class Line:
             see: `tuindow.structs.Style.from_keywords`
         """
 
+        self.version = 1
+        self._clean_version = 0
+        self._on_change: Optional[Callable[[], None]] = None
+        self._display = ""
+        self._display_bytes: Optional[bytes] = None
+        self._data = ""
+        self._style = structs.Style()
+        self._length = 1
+        # pads are fixed unless the style uses variable length padding,
+        # so they are computed once per style/length change rather than
+        # once per display update
+        self._static_pads: Optional[Tuple[str, str]] = ("", "")
+        self._max_middle = 1
+        self._update_display: Callable[[], None]
+        self._refresh_pad_cache()
+
         self.length = length
         self.data = data
         if style is not None:
@@ -61,6 +90,28 @@ class Line:
             f"fill={self.fill!r}, padding={self.padding!r}, padding_fills={self.padding_fills!r})"
         )
 
+    @property
+    def dirty(self) -> bool:
+        """
+        True when the line has changed since `dirty` was last set to False.
+        """
+
+        return self.version != self._clean_version
+
+    @dirty.setter
+    def dirty(self, value: bool) -> None:
+        """
+        Setting True records a new version of the line, setting False
+        marks the current version as seen.
+        """
+
+        if value:
+            self.version += 1
+            if self._on_change is not None:
+                self._on_change()
+        else:
+            self._clean_version = self.version
+
     @property
     def style(self) -> structs.Style:
         """
@@ -75,12 +126,16 @@ class Line:
         Sets the lines style configuration.
         """
 
+        if style is self._style:
+            return
+
         with validation.pool(ValueError):
             validation.length_one_string("fill style", style.fill)
             validation.padding_overflow(style.padding, self.length)
             validation.padding_fills(style.padding)
 
         self._style = style
+        self._refresh_pad_cache()
         self._update_display()
 
     @property
@@ -201,6 +256,7 @@ class Line:
                 validation.greater_than_x("Line length", value, 0)
                 validation.padding_overflow(self.style.padding, value)
             self._length = value
+            self._refresh_pad_cache()
             self._update_display()
 
     @property
@@ -214,18 +270,93 @@ class Line:
 
         return self._display
 
-    def _update_display(self) -> None:
-        """Updates the display data"""
+    @property
+    def display_bytes(self) -> bytes:
+        """
+        Gets the display value encoded as utf-8.
+
+        Encoded lazily and cached until the display next changes, so
+        repeated redraws of an unchanged line skip the re-encode.
+        """
 
-        lpad, rpad = self.style.calculate_pads(self._data, self._length)
-        display_length = self.length - len(lpad) - len(rpad)
-        remaining = display_length - len(self.data)
-        if remaining <= 0:
-            display_data = self._data[:display_length]
+        encoded = self._display_bytes
+        if encoded is None:
+            encoded = self._display.encode()
+            self._display_bytes = encoded
+        return encoded
+
+    def _refresh_pad_cache(self) -> None:
+        """
+        Precomputes the pad strings when the configured padding is constant
+        and binds the display update implementation suited to the style.
+
+        Variable length padding depends on the data being displayed so in
+        that case the pads have to be recalculated on every display update.
+        """
+
+        values = self._style.padding.values
+        if values[0] >= 0 and values[1] >= 0:
+            pads = self._style.padding.pads
+            self._static_pads = pads
+            self._max_middle = self._length - len(pads[0]) - len(pads[1])
+            if pads[0] or pads[1]:
+                impl = _update_display_static_pads
+            else:
+                impl = _update_display_no_pads
         else:
-            display_data = self._data + self.style.fill * remaining
-        self._display = lpad + display_data + rpad
-        self.dirty = True
+            self._static_pads = None
+            impl = _update_display_variable_pads
+        self._update_display = types.MethodType(impl, self)
+
+
+def _update_display_no_pads(line: Line) -> None:
+    """Display update for the common unpadded case -- a single slice."""
+
+    data = line._data
+    remaining = line._length - len(data)
+    if remaining <= 0:
+        line._display = data[: line._length]
+    else:
+        line._display = data + line._style.fill * remaining
+    line._display_bytes = None
+    line.version += 1
+    if line._on_change is not None:
+        line._on_change()
+
+
+def _update_display_static_pads(line: Line) -> None:
+    """Display update for styles with constant, precomputed padding."""
+
+    assert line._static_pads is not None
+    lpad, rpad = line._static_pads
+    data = line._data
+    remaining = line._max_middle - len(data)
+    if remaining <= 0:
+        display_data = data[: line._max_middle]
+    else:
+        display_data = data + line._style.fill * remaining
+    line._display = lpad + display_data + rpad
+    line._display_bytes = None
+    line.version += 1
+    if line._on_change is not None:
+        line._on_change()
+
+
+def _update_display_variable_pads(line: Line) -> None:
+    """Display update for styles whose pads depend on the data length."""
+
+    lpad, rpad = line._style.calculate_pads(line._data, line._length)
+    display_length = line._length - len(lpad) - len(rpad)
+    remaining = display_length - len(line._data)
+    if remaining <= 0:
+        display_data = line._data[:display_length]
+    else:
+        display_data = line._data + line._style.fill * remaining
+    line._display = lpad + display_data + rpad
+    line._display_bytes = None
+    line.version += 1
+    if line._on_change is not None:
+        line._on_change()
 
 
 class Panel:
@@ -239,11 +370,16 @@ class Panel:
     removing, adding, and modifying it's existing lines as needed.
     """
 
-    available: int = -1
-    cursor: cursor.Cursor
-    _lines: List[Line]
-    _style: structs.Style
-    _rect: structs.Rect = structs.Rect(-1, -1, -1, -1)
+    __slots__ = (
+        "available",
+        "cursor",
+        "version",
+        "_lines",
+        "_style",
+        "_rect",
+        "_rect_tuple",
+        "_painted_version",
+    )
 
     def __init__(
         self,
@@ -267,18 +403,28 @@ class Panel:
             see: tuindow.structs.Style.from_keywords
         """
 
-        self._lines = []
+        self.available = -1
+        self.version = 0
+        # version last painted by the draw machinery; lets a fully
+        # unchanged panel be skipped without touching its lines
+        self._painted_version = -1
+        self._rect = structs.Rect(-1, -1, -1, -1)
+        self._rect_tuple = (-1, -1, -1, -1)
+        self._lines: List[Line] = []
         self._style = (
             default_style
             if default_style is not None
             else structs.Style.from_keywords(**kwargs)
         )
 
+        # the cursor reads on every keystroke so it gets a direct path to
+        # the line data, skipping __getitem__ and the data property.
+        # writes stay on writeln which maintains the `available` count.
         self.cursor = cursor.Cursor(
             index=0,
             line=0,
             maxline=0,
-            readline=self.readln,
+            readline=self._read_data,
             writeline=self.writeln,
         )
 
@@ -330,6 +476,40 @@ class Panel:
             self.available -= 1
         ln.data = value
 
+    def write_many(
+        self,
+        values: Iterable[str],
+        start: int = 0,
+        clear_remaining: bool = False,
+    ) -> None:
+        """
+        Writes each value to consecutive Line objects beginning at `start`.
+
+        When `clear_remaining` is True any lines after the last written
+        value are cleared.
+
+        This is equivalent to (but cheaper than) calling `writeln` once
+        per value in a loop.
+        """
+
+        lines = self._lines
+        index = start
+        for value in values:
+            ln = lines[index]
+            data = ln._data
+            if data and not value:
+                self.available += 1
+            elif not data and value:
+                self.available -= 1
+            ln.data = value
+            index += 1
+
+        if clear_remaining:
+            for ln in lines[index:]:
+                if ln._data:
+                    self.available += 1
+                    ln.data = ""
+
     def readln(self, index: int) -> str:
         """
         Gets the `data` attribute for the Line object at the given index.
@@ -337,6 +517,9 @@ class Panel:
 
         return self[index].data
 
+    def _read_data(self, index: int) -> str:
+        return self._lines[index]._data
+
     def clearln(self, index: int) -> None:
         """
         Sets the `data` attribute for the Line object
@@ -355,7 +538,11 @@ class Panel:
         """
 
         self._lines.insert(index, self._default_line(value))
-        del self._lines[-1]
+        clipped = self._lines.pop()
+        if not clipped._data:
+            self.available -= 1
+        if not value:
+            self.available += 1
         for ln in self[index:]:
             ln.dirty = True
 
@@ -367,8 +554,10 @@ class Panel:
         new default Line object will be inserted at the end of the panel.
         """
 
-        del self._lines[index]
+        clipped = self._lines.pop(index)
         self._lines.append(self._default_line())
+        if clipped._data:
+            self.available += 1
         for ln in self[index:]:
             ln.dirty = True
 
@@ -433,6 +622,16 @@ class Panel:
                 ln.dirty = True
             self._lines = fresh_lines + existing_slice
 
+        # shifts swap whole Line objects in and out so recount instead
+        # of threading deltas through each branch
+        self.available = sum(
+            1 if ln._data == "" else 0 for ln in self._lines
+        )
+        # fresh Line objects don't fire _on_change at construction, so a
+        # full-height shift would otherwise leave the panel version equal
+        # to the painted version and the cleared panel never repaints
+        self.version += 1
+
     @property
     def first_available(self) -> Optional[int]:
         """
@@ -440,7 +639,9 @@ class Panel:
         in the panel.
         """
 
-        for i, ln in enumerate(self):
+        if not self.available:
+            return None
+        for i, ln in enumerate(self._lines):
             if not ln.data:
                 return i
         return None
@@ -491,7 +692,7 @@ class Panel:
         (0, 0) is the top left, units are number of characters
         """
 
-        return (self.left, self.top, self.width, self.height)
+        return self._rect_tuple
 
     @rect.setter
     def rect(self, value: Tuple[int, int, int, int]) -> None:
@@ -511,6 +712,7 @@ class Panel:
             validation.greater_than_x("Panel.height", rect.height, 0)
 
         self._rect = rect
+        self._rect_tuple = (rect.left, rect.top, rect.width, rect.height)
 
         if len(self._lines) < rect.height:
             grow_amount = rect.height - len(self._lines)
@@ -536,8 +738,13 @@ class Panel:
 
         return self._rect
 
+    def _bump_version(self) -> None:
+        self.version += 1
+
     def _default_line(self, data="") -> Line:
-        return Line(self.width, style=self._style, data=data)
+        ln = Line(self.width, style=self._style, data=data)
+        ln._on_change = self._bump_version
+        return ln
 
     @property
     def left(self) -> int:
@@ -3,11 +3,90 @@ A helper object for navigating the lines of the user interface
 """
 
 from typing import Callable
+from typing import List
+from typing import Optional
 from typing import Tuple
 
 from . import validation
 
 
+class GapBuffer:
+    """
+    An edit buffer splitting the line at the gap (cursor position) so
+    that single character edits touch only the characters around the
+    cursor rather than re-slicing the entire line.
+    """
+
+    __slots__ = ("_pre", "_post")
+
+    _pre: List[str]
+    _post: List[str]
+
+    def __init__(self, data: str, gap: int) -> None:
+        self._pre = list(data[:gap])
+        self._post = list(data[gap:])
+
+    def __str__(self) -> str:
+        return "".join(self._pre) + "".join(self._post)
+
+    def __len__(self) -> int:
+        return len(self._pre) + len(self._post)
+
+    def move_gap(self, index: int) -> None:
+        """
+        Moves the gap to the given index, shuffling only the characters
+        between the old and new positions.
+        """
+
+        pre = self._pre
+        post = self._post
+        delta = index - len(pre)
+        if delta > 0:
+            pre.extend(post[:delta])
+            del post[:delta]
+        elif delta < 0:
+            post[:0] = pre[delta:]
+            del pre[delta:]
+
+    def insert(self, value: str) -> None:
+        """
+        Inserts the given string at the gap.
+        """
+
+        self._pre.extend(value)
+
+    def backspace(self, n: int) -> str:
+        """
+        Removes up to `n` characters behind the gap, or everything
+        behind the gap when `n` is negative. Returns what was removed.
+        """
+
+        if n == 0:
+            # -n slicing below would read as [-0:] and consume everything
+            return ""
+        if n < 0 or n >= len(self._pre):
+            removed = "".join(self._pre)
+            self._pre.clear()
+        else:
+            removed = "".join(self._pre[-n:])
+            del self._pre[-n:]
+        return removed
+
+    def delete(self, n: int) -> str:
+        """
+        Removes up to `n` characters in front of the gap, or everything
+        in front of the gap when `n` is negative. Returns what was removed.
+        """
+
+        if n < 0 or n >= len(self._post):
+            removed = "".join(self._post)
+            self._post.clear()
+        else:
+            removed = "".join(self._post[:n])
+            del self._post[:n]
+        return removed
+
+
 class Overscroll(Exception):
     """
     Raised when a Cursor object tries to scroll outside it's allowed
@@ -20,41 +99,62 @@ class Overscroll(Exception):
 
 
 class Cursor:
+    __slots__ = (
+        "_index",
+        "_line",
+        "_readline",
+        "_writeline",
+        "_maxline",
+        "_buffer",
+        "_buffer_line",
+        "_buffer_value",
+    )
+
     def __init__(
         self,
         index: int,
         line: int,
-        maxline: int,
+        maxline: Optional[int],
         readline: Callable[[int], str],
         writeline: Callable[[int, str], None],
     ):
         self._index = index
         self._line = line
-        self._readline = lambda: readline(self.line)
-        self._writeline = lambda v: writeline(self.line, v)
+        self._readline = readline
+        self._writeline = writeline
         self._maxline = maxline
+        self._buffer: Optional[GapBuffer] = None
+        self._buffer_line = -1
+        self._buffer_value: Optional[str] = None
 
     def __repr__(self) -> str:
-        return f"<Cursor line={self.line} index={self.index}>"
+        return f"<Cursor line={self._line} index={self._index}>"
 
     @property
-    def maxline(self) -> int:
+    def maxline(self) -> Optional[int]:
         """
         Gets the maximum line index this cursor is allowed to visit.
+
+        None means the cursor is unbounded.
         """
 
         return self._maxline
 
     @maxline.setter
-    def maxline(self, value: int) -> None:
+    def maxline(self, value: Optional[int]) -> None:
         """
         Sets maximum line index this cursor is allowed to visit and clamps
         the cursor's line index to be within the new range.
+
+        None removes the bound.
         """
 
+        if value is None:
+            self._maxline = None
+            return
         validation.not_negative("Cursor.maxline", value)
         self._maxline = value
-        self.line = min(self.line, self._maxline)
+        self._set_line(min(self._line, value))
 
     @property
     def index(self) -> int:
@@ -75,15 +175,18 @@ class Cursor:
         value to this cursor's acceptable range of values.
         """
 
+        self._set_index(value)
+
+    def _set_index(self, value: int) -> None:
         if value == 0:
             self._index = 0
             return
 
-        length = len(self._readline())
+        length = len(self._readline(self._line))
         if value < 0:
             self._index = max(0, length + 1 + value)
         else:
-            self._index = min(value, len(self._readline()))
+            self._index = value if value < length else length
 
     @property
     def line(self) -> int:
@@ -104,16 +207,23 @@ class Cursor:
         value to this cursor's acceptable range of values.
         """
 
+        self._set_line(value)
+
+    def _set_line(self, value: int) -> None:
         current = self._line
+        maxline = self._maxline
 
         if value < 0:
-            value = max(0, self._maxline + 1 + value)
-        else:
-            value = min(value, self._maxline)
+            # negative values wrap from the end; without a bound there
+            # is no end to wrap from so they clamp to the first line
+            value = 0 if maxline is None else max(0, maxline + 1 + value)
+        elif maxline is not None:
+            value = min(value, maxline)
 
+        if value == current:
+            return
         self._line = value
-        if value != current:
-            self.index = self.index
+        self._set_index(self._index)
 
     @property
     def position(self) -> Tuple[int, int]:
@@ -131,8 +241,8 @@ class Cursor:
             self.index = index
         """
 
-        self.line = value[1]
-        self.index = value[0]
+        self._set_line(value[1])
+        self._set_index(value[0])
 
     @property
     def data(self) -> str:
@@ -140,7 +250,33 @@ class Cursor:
         Reads the entire line currently under the cursor.
         """
 
-        return self._readline()
+        return self._readline(self._line)
+
+    def _edit_buffer(self) -> GapBuffer:
+        """
+        Gets the gap buffer for the current line, rebuilding it when the
+        line has changed behind our back (detected by identity against
+        the last value this cursor read or wrote).
+        """
+
+        current = self._readline(self._line)
+        if (
+            self._buffer is None
+            or self._buffer_line != self._line
+            or self._buffer_value is not current
+        ):
+            self._buffer = GapBuffer(current, self._index)
+            self._buffer_line = self._line
+            self._buffer_value = current
+        else:
+            self._buffer.move_gap(self._index)
+        return self._buffer
+
+    def _flush_buffer(self) -> None:
+        assert self._buffer is not None
+        value = str(self._buffer)
+        self._buffer_value = value
+        self._writeline(self._line, value)
 
     def insert(self, value: str) -> None:
         """
@@ -148,10 +284,9 @@ class Cursor:
         the cursor's `index` attribute accordingly.
         """
 
-        current = self._readline()
-        self._writeline(
-            current[: self._index] + value + current[self._index :]
-        )
+        buffer = self._edit_buffer()
+        buffer.insert(value)
+        self._flush_buffer()
         self._index += len(value)
 
     def backspace(self, n: int = 1) -> str:
@@ -166,17 +301,15 @@ class Cursor:
         if self._index == 0:
             return ""
 
-        current = self._readline()
+        buffer = self._edit_buffer()
 
         if self._index <= n or n < 0:
-            self._writeline(current[self._index :])
-            removed = current[: self._index]
+            removed = buffer.backspace(-1)
+            self._flush_buffer()
             self._index = 0
         else:
-            self._writeline(
-                current[: self._index - n] + current[self._index :]
-            )
-            removed = current[self._index - n : self._index]
+            removed = buffer.backspace(n)
+            self._flush_buffer()
             self._index -= n
         return removed
 
@@ -190,24 +323,22 @@ class Cursor:
         Returns the data that was removed or ""
         """
 
-        current = self._readline()
+        buffer = self._edit_buffer()
 
-        if self._index >= len(current):
+        if self._index >= len(buffer):
             return ""
 
-        if n >= len(current) - self._index or n < 0:
-            self._writeline(current[: self._index])
-            return current[self._index :]
-
-        self._writeline(current[: self._index] + current[self._index + n :])
-        return current[self._index : self._index + n]
+        removed = buffer.delete(n)
+        self._flush_buffer()
+        return removed
 
     def left(self, n: int = 1) -> None:
         """
         Moves the index left `n` spaces. Does not wrap and clamps index to valid values.
         """
 
-        validation.not_negative("Cursor.left n", n)
+        if n < 0:
+            raise ValueError(f"Cursor.left n ({n!r}) cannot be negative")
         self._index = max(0, self._index - n)
 
     def right(self, n: int = 1) -> None:
@@ -215,8 +346,9 @@ class Cursor:
         Moves the index right `n` spaces. Does not wrap and clamps index to valid values.
         """
 
-        validation.not_negative("Cursor.right n", n)
-        current = self._readline()
+        if n < 0:
+            raise ValueError(f"Cursor.right n ({n!r}) cannot be negative")
+        current = self._readline(self._line)
         self._index = min(len(current), self._index + n)
 
     def up(self, n: int = 1) -> None:
@@ -228,14 +360,15 @@ class Cursor:
             NOTE: check Overscroll.amount for the extent of the overscroll
         """
 
-        validation.not_negative("Cursor.up n", n)
-        new_line_index = self.line - n
+        if n < 0:
+            raise ValueError(f"Cursor.up n ({n!r}) cannot be negative")
+        new_line_index = self._line - n
         if new_line_index < 0:
             over = 0 - new_line_index
-            self.line = 0
+            self._set_line(0)
             raise Overscroll(over)
         else:
-            self.line = new_line_index
+            self._set_line(new_line_index)
 
     def down(self, n: int = 1) -> None:
         """
@@ -246,19 +379,20 @@ class Cursor:
             NOTE: check Overscroll.amount for the extent of the overscroll
         """
 
-        validation.not_negative("Cursor.down n", n)
+        if n < 0:
+            raise ValueError(f"Cursor.down n ({n!r}) cannot be negative")
 
-        if self.maxline is None:
-            self.line += n
+        if self._maxline is None:
+            self._set_line(self._line + n)
             return
 
-        new_line_index = self.line + n
-        over = new_line_index - self.maxline
+        new_line_index = self._line + n
+        over = new_line_index - self._maxline
         if over > 0:
-            self.line = self.maxline
+            self._set_line(self._maxline)
             raise Overscroll(over)
         else:
-            self.line = new_line_index
+            self._set_line(new_line_index)
 
     def consume_line(self) -> str:
         """
@@ -269,7 +403,7 @@ class Cursor:
             sets line data to ""
         """
 
-        self.index = 0
+        self._set_index(0)
         return self.delete(-1)
 
     def pan(self, display_length: int) -> str:
@@ -279,11 +413,11 @@ class Cursor:
         end of the display.
         """
 
-        data = self._readline()
+        data = self._readline(self._line)
         # if there is enough space to display the data no panning is necessary
         if len(data) < display_length:
             return data
         # otherwise we aim to have the cursor positioned
         # at the end of the displayable length
-        start = max(0, self.index - (display_length - 1))
+        start = max(0, self._index - (display_length - 1))
         return data[start : start + display_length]
@@ -39,6 +39,9 @@ class Editor:
             self.lines = [""]
 
         self.display_offset = 0
+        # stringified line numbers are reused across redraws; line
+        # numbers are monotone so the cache never needs invalidation
+        self._lineno_cache = []
 
     def layout(self, width: int, height: int):
         # the library calls out to us whenever it gets updated information
@@ -79,12 +82,11 @@ class Editor:
         self.update_editor_window()
 
     def update_editor_window(self):
-        for i in range(self.main_panel.height):
-            line_index = i + self.display_offset
-            if line_index < len(self.lines):
-                self.main_panel.writeln(i, self.lines[line_index])
-            else:
-                self.main_panel.clearln(i)
+        offset = self.display_offset
+        self.main_panel.write_many(
+            self.lines[offset : offset + self.main_panel.height],
+            clear_remaining=True,
+        )
 
     def update_help_display(self):
         self.help_panel.writeln(2, self.filename)
@@ -94,12 +96,15 @@ class Editor:
             self.help_panel.writeln(1, "COMMAND MODE:   " + self.COMMAND_HELP)
 
     def update_line_numbers(self):
-        for i in range(self.line_number_panel.height):
-            number = i + 1 + self.display_offset
-            if number > len(self.lines):
-                self.line_number_panel.clearln(i)
-            else:
-                self.line_number_panel.writeln(i, str(number))
+        offset = self.display_offset
+        visible = min(self.line_number_panel.height, len(self.lines) - offset)
+        cache = self._lineno_cache
+        while len(cache) < offset + visible:
+            cache.append(str(len(cache) + 1))
+        self.line_number_panel.write_many(
+            cache[offset : offset + visible],
+            clear_remaining=True,
+        )
 
     @property
     def file_line(self) -> int:
@@ -113,9 +118,13 @@ class Editor:
         # We will have to persist line data on our own aswell.
         # If we call this after all state changes we will stay synced.
 
-        while self.file_line > len(self.lines) - 1:
-            self.lines.append("")
-        self.lines[self.file_line] = self.main_panel.cursor.data
+        file_line = self.file_line
+        missing = file_line - len(self.lines) + 1
+        if missing > 0:
+            self.lines.extend([""] * missing)
+        data = self.main_panel.cursor.data
+        if self.lines[file_line] is not data:
+            self.lines[file_line] = data
 
     def write_from_file_data(self, display_index: int) -> None:
         # Writes a line we have cached away in self.lines back onto the display
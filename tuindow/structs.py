@@ -4,33 +4,61 @@ Some data structures representing common themes in the package.
 This module should not rely on other modules within the package.
 """
 
+import functools
+import sys
+
+from typing import Iterator
 from typing import NamedTuple
 from typing import Tuple
 from typing import Optional
 from typing import Union
 
 
-class Rect(NamedTuple):
+class Rect:
     """
     A rectangular region within a screen space coordinate system
     where (0, 0) is the top left corner.
+
+    Rects are treated as immutable; `right` and `bottom` are computed
+    once at construction so the intersection tests in the draw loop are
+    plain attribute loads rather than property calls.
     """
 
+    __slots__ = ("left", "top", "width", "height", "right", "bottom")
+
     left: int
     top: int
     width: int
     height: int
+    right: int
+    bottom: int
+
+    def __init__(self, left: int, top: int, width: int, height: int) -> None:
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+        self.right = left + width
+        self.bottom = top + height
+
+    def __repr__(self) -> str:
+        return (
+            f"Rect(left={self.left!r}, top={self.top!r}, "
+            f"width={self.width!r}, height={self.height!r})"
+        )
 
-    def __iter__(self):
+    def __iter__(self) -> Iterator[int]:
         return iter((self.left, self.top, self.width, self.height))
 
-    @property
-    def right(self) -> int:
-        return self.left + self.width
-
-    @property
-    def bottom(self) -> int:
-        return self.top + self.height
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Rect):
+            return NotImplemented
+        return (
+            self.left == other.left
+            and self.top == other.top
+            and self.width == other.width
+            and self.height == other.height
+        )
 
     def intersects(self, other: "Rect") -> bool:
         """
@@ -68,11 +96,13 @@ class Padding(NamedTuple):
         values < 0 are considered variable length padding and treated as weights
     pads: (left, right)
         the actual pads described by the former attributes
+    total: the combined length of the pads
     """
 
     fills: Tuple[str, str]
     values: Tuple[int, int]
     pads: Tuple[str, str]
+    total: int
 
     @classmethod
     def calculate(
@@ -83,14 +113,29 @@ class Padding(NamedTuple):
         calculated from the given parameters.
         """
 
-        return cls(
-            fills,
-            values,
-            (
-                fills[0] * values[0] if values[0] >= 0 else "",
-                fills[1] * values[1] if values[1] >= 0 else "",
-            ),
-        )
+        return _calculate_padding(fills, values)
+
+
+@functools.lru_cache(maxsize=64)
+def _calculate_padding(
+    fills: Tuple[str, str], values: Tuple[int, int]
+) -> Padding:
+    # applications use only a handful of (fills, values) combinations,
+    # so repeat calculations collapse into a cache lookup
+    #
+    # pads repeat across lines/frames; interning them makes the
+    # downstream equality checks pointer comparisons
+    pads = (
+        sys.intern(fills[0] * values[0]) if values[0] > 0 else "",
+        sys.intern(fills[1] * values[1]) if values[1] > 0 else "",
+    )
+    return Padding(fills, values, pads, len(pads[0]) + len(pads[1]))
+
+
+# applications use a small number of distinct styles; interning the
+# instances produced by Style.from_keywords makes repeated style checks
+# identity comparisons and skips rebuilding identical Padding tuples
+_style_intern: dict = {}
 
 
 class Style(NamedTuple):
@@ -156,11 +201,16 @@ class Style(NamedTuple):
             padding_fills = (padding_fills, padding_fills)
         if isinstance(padding, int):
             padding = (padding, padding)
-        return cls(
-            padding=Padding.calculate(padding_fills, padding),
-            fill=fill,
-            attributes=attributes,
-        )
+        key = (padding_fills, padding, fill, attributes)
+        style = _style_intern.get(key)
+        if style is None:
+            style = cls(
+                padding=Padding.calculate(padding_fills, padding),
+                fill=fill,
+                attributes=attributes,
+            )
+            _style_intern[key] = style
+        return style
 
     def calculate_pads(self, string: str, max_length: int) -> Tuple[str, str]:
         """
@@ -168,49 +218,48 @@ class Style(NamedTuple):
         assuming a maximum line length of `max_length`.
         """
 
-        final_display_length = max_length - sum(map(len, self.padding.pads))
-        remaining = final_display_length - len(string)
+        padding = self.padding
+        values = padding.values
 
-        if remaining == 0:
-            return self.padding.pads
-
-        left_pad, right_pad = self.padding.pads
-
-        if self.padding.values[0] >= 0:
-            if self.padding.values[1] < 0:
-                # right pad variable/left pad constant -- extend right with padding fill
-                right_pad = remaining * self.padding.fills[1] + right_pad
-            else:
-                # both pads constant, extend display with default fill
-                # caller is responsible for filling the remaining display
-                pass
-
-        elif self.padding.values[1] >= 0:
-            # left pad is variable/right pad is constant -- extend left with padding fill
-            left_pad += remaining * self.padding.fills[0]
-
-        else:
-            # both pads are variable, treat values like weights and fill with padding fill
-            total = sum(self.padding.values)
-            left_extra = int(round(self.padding.values[0] / total * remaining))
-            right_extra = int(
-                round(self.padding.values[1] / total * remaining)
-            )
+        if values[0] >= 0 and values[1] >= 0:
+            # both pads constant, extend display with default fill
+            # caller is responsible for filling the remaining display
+            return padding.pads
 
-            # fix off by one errors from rounding, leaving higher weight with the extra padding
-            off = remaining - (left_extra + right_extra)
-            assert off in (-1, 0, 1)
-            if off == 1:
-                if left_extra >= right_extra:
-                    left_extra += off
-                else:
-                    right_extra += off
-            elif off == -1:
-                if left_extra >= right_extra:
-                    right_extra += off
-                else:
-                    left_extra += off
-            left_pad += self.padding.fills[0] * left_extra
-            right_pad += self.padding.fills[1] * right_extra
-
-        return left_pad, right_pad
+        remaining = max_length - padding.total - len(string)
+
+        if remaining == 0:
+            return padding.pads
+
+        return _variable_pads(padding, remaining)
+
+
+@functools.lru_cache(maxsize=512)
+def _variable_pads(padding: Padding, remaining: int) -> Tuple[str, str]:
+    # at steady terminal size the same (padding, remaining) pairs recur
+    # every redraw; caching skips the string multiplications entirely
+    values = padding.values
+    left_pad, right_pad = padding.pads
+
+    # str.ljust/rjust extend the constant pads in a single C-level
+    # operation instead of a Python-level multiply + concatenate
+    if values[0] >= 0:
+        # right pad variable/left pad constant -- extend right with padding fill
+        right_pad = right_pad.rjust(len(right_pad) + remaining, padding.fills[1])
+
+    elif values[1] >= 0:
+        # left pad is variable/right pad is constant -- extend left with padding fill
+        left_pad = left_pad.ljust(len(left_pad) + remaining, padding.fills[0])
+
+    else:
+        # both pads are variable, treat values like weights and fill
+        # with padding fill -- an integer-only proportional split,
+        # rounding half towards the left pad
+        left_weight = -values[0]
+        total = left_weight - values[1]
+        left_extra = (2 * left_weight * remaining + total) // (2 * total)
+        right_extra = remaining - left_extra
+        left_pad = left_pad.ljust(len(left_pad) + left_extra, padding.fills[0])
+        right_pad = right_pad.rjust(len(right_pad) + right_extra, padding.fills[1])
+
+    return left_pad, right_pad
@@ -3,6 +3,7 @@ This module is used internally for validation
 """
 
 import contextlib
+import threading
 
 from typing import List
 from typing import Iterator
@@ -12,20 +13,30 @@ from typing import Union
 from . import structs
 
 
-_pooling = False
-_errors: List[Exception] = []
+class _State(threading.local):
+    """
+    Pooling state is kept per-thread so validators running on one
+    thread can't leak errors into a pool opened on another.
+    """
+
+    def __init__(self) -> None:
+        self.pooling = False
+        self.errors: List[Exception] = []
+
+
+_state = _State()
 
 
 @contextlib.contextmanager
 def pool(exception_type: Type[Exception]) -> Iterator[None]:
-    global _pooling
-    _pooling = True
+    state = _state
+    state.pooling = True
     yield
-    _pooling = False
-    if not _errors:
+    state.pooling = False
+    if not state.errors:
         return
-    errors = _errors.copy()
-    _errors.clear()
+    errors = state.errors.copy()
+    state.errors.clear()
     if len(errors) == 1:
         raise exception_type(str(errors[0]))
     raise exception_type(
@@ -42,8 +53,9 @@ def pool(exception_type: Type[Exception]) -> Iterator[None]:
 
 
 def _error(exc: Exception) -> None:
-    if _pooling:
-        _errors.append(exc)
+    state = _state
+    if state.pooling:
+        state.errors.append(exc)
     else:
         raise exc
 
@@ -3,6 +3,8 @@ This module is used internally for tracking `dirty` screen regions.
 """
 
 from typing import List
+from typing import Optional
+from typing import Set
 
 from . import structs
 
@@ -20,13 +22,21 @@ class Window:
     """
 
     _rect: structs.Rect
-    _drawn: List[structs.Rect]
+    _drawn: List[Optional[structs.Rect]]
     _ndrawn: int
+    _drawn_ids: Set[int]
 
     def __init__(self, x: int, y: int, width: int, height: int) -> None:
         self._rect = structs.Rect(x, y, width, height)
-        self._drawn = []
+        # preallocated and grown by doubling so the draw loop only ever
+        # index-assigns; slots past _ndrawn are masked off
+        self._drawn = [None] * 16
         self._ndrawn = 0
+        # ids of the rects in self._drawn[:self._ndrawn]; lets `draw`
+        # answer the common "same rect redrawn unchanged" case in O(1)
+        # (evicted rects stay referenced in the masked tail of the list,
+        # so the ids in this set are never stale)
+        self._drawn_ids = set()
 
     def resize(self, x: int, y: int, width: int, height: int) -> None:
         """
@@ -35,6 +45,7 @@ class Window:
 
         self._rect = structs.Rect(x, y, width, height)
         self._ndrawn = 0
+        self._drawn_ids.clear()
 
     def draw(self, rect: structs.Rect) -> bool:
         """
@@ -56,30 +67,49 @@ class Window:
         if not self._rect.contains(rect):
             raise BoundsError(rect, self)
 
+        drawn_ids = self._drawn_ids
+        if id(rect) in drawn_ids:
+            # no rects in the drawn list intersect so if `rect` is
+            # already present we know it's previously drawn state hasn't
+            # been invalidated (unless data has gone stale)
+            # which is handled elsewhere
+            return False
+
+        # hoist the rect's edges and the drawn list into locals and
+        # inline the intersection test -- this loop runs once per drawn
+        # rect per draw call and the method-call overhead dominates it
+        left = rect.left
+        top = rect.top
+        right = rect.right
+        bottom = rect.bottom
+        drawn = self._drawn
+        ndrawn = self._ndrawn
+
         index = 0
-        while index != self._ndrawn:
-            drawn_rect = self._drawn[index]
-            if rect is drawn_rect:
-                # no rects in the drawn list intersect so if `rect`
-                # collides with itself by identity we know it's previously
-                # drawn state hasn't been invalidated
-                # (unless data has gone stale) which is handled elsewhere
-                return False
-            if rect.intersects(drawn_rect):
-                if index != self._ndrawn - 1:
-                    self._drawn[index], self._drawn[self._ndrawn - 1] = (
-                        self._drawn[self._ndrawn - 1],
-                        self._drawn[index],
+        while index != ndrawn:
+            drawn_rect = drawn[index]
+            assert drawn_rect is not None
+            if (
+                left < drawn_rect.right
+                and top < drawn_rect.bottom
+                and right > drawn_rect.left
+                and bottom > drawn_rect.top
+            ):
+                if index != ndrawn - 1:
+                    drawn[index], drawn[ndrawn - 1] = (
+                        drawn[ndrawn - 1],
+                        drawn[index],
                     )
-                self._ndrawn -= 1
+                ndrawn -= 1
+                drawn_ids.discard(id(drawn_rect))
             else:
                 index += 1
 
         # ever other rect this rect intersects with has been cleared,
         # now we just have to add this rect to the drawn list
-        if len(self._drawn) == self._ndrawn:
-            self._drawn.append(rect)
-        else:
-            self._drawn[self._ndrawn] = rect
-        self._ndrawn += 1
+        if len(drawn) == ndrawn:
+            drawn.extend([None] * ndrawn)
+        drawn[ndrawn] = rect
+        drawn_ids.add(id(rect))
+        self._ndrawn = ndrawn + 1
         return True